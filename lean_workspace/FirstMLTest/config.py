@@ -6,9 +6,15 @@ This file contains all configurable parameters for the strategy template.
 Customize these values for your specific strategy implementation.
 """
 
+import functools
+from dataclasses import dataclass
 from datetime import datetime
+from enum import IntEnum
+from types import MappingProxyType
 from typing import List, Dict, Any
 
+import numpy as np
+
 # ==================== BASIC STRATEGY SETTINGS ====================
 
 # Strategy identification
@@ -23,14 +29,14 @@ INITIAL_CASH = 100000
 
 # ==================== TRADING PARAMETERS ====================
 
-# Symbols to trade
-SYMBOLS = [
+# Symbols to trade (tuple: immutable, smaller, faster to iterate)
+SYMBOLS = (
     "SPY",   # S&P 500 ETF
     "QQQ",   # Nasdaq 100 ETF
     "IWM",   # Russell 2000 ETF
     "EFA",   # Developed Markets ETF
     "EEM",   # Emerging Markets ETF
-]
+)
 
 # Rebalancing settings
 REBALANCE_FREQUENCY = 5  # Days between rebalances
@@ -72,7 +78,7 @@ SUPPORTED_MODEL_TYPES = [
 ]
 
 # Feature columns (must match model training)
-FEATURE_COLUMNS = [
+FEATURE_COLUMNS = (
     'returns_1d',      # 1-day return
     'returns_5d',      # 5-day return
     'returns_20d',     # 20-day return
@@ -83,7 +89,7 @@ FEATURE_COLUMNS = [
     'volatility',      # Price volatility
     'momentum',        # Price momentum
     'trend_strength',  # Trend strength (ADX)
-]
+)
 
 # Feature engineering settings
 FEATURE_CLIPPING = {
@@ -95,6 +101,18 @@ FEATURE_CLIPPING = {
     'momentum': (-0.5, 0.5)
 }
 
+# Clipping bounds as vectors aligned with FEATURE_COLUMNS, so a whole
+# feature matrix can be clipped in one vectorized pass (unclipped
+# features get infinite bounds)
+FEATURE_CLIP_LO = np.array(
+    [FEATURE_CLIPPING.get(c, (-np.inf, np.inf))[0] for c in FEATURE_COLUMNS],
+    dtype=np.float32,
+)
+FEATURE_CLIP_HI = np.array(
+    [FEATURE_CLIPPING.get(c, (-np.inf, np.inf))[1] for c in FEATURE_COLUMNS],
+    dtype=np.float32,
+)
+
 # Prediction settings
 PREDICTION_THRESHOLD = 0.1      # Minimum prediction confidence
 USE_PREDICTION_PROBABILITIES = True  # Use probabilities if available
@@ -121,6 +139,30 @@ INDICATORS = {
     'adx_period': 14,    # ADX period
 }
 
+# Struct-of-arrays view of the indicator parameters: one contiguous
+# int32 vector indexed by IndIdx, so the whole parameter block can be
+# passed as a single argument into numba/cython indicator kernels.
+# INDICATORS above remains the legacy dict adapter.
+class IndIdx(IntEnum):
+    SMA_SHORT = 0
+    SMA_LONG = 1
+    RSI_PERIOD = 2
+    BB_PERIOD = 3
+    BB_STD = 4
+    MACD_FAST = 5
+    MACD_SLOW = 6
+    MACD_SIGNAL = 7
+    ATR_PERIOD = 8
+    STOCH_PERIOD = 9
+    MOMENTUM_PERIOD = 10
+    ROC_PERIOD = 11
+    ADX_PERIOD = 12
+
+INDICATOR_PARAMS = np.array(
+    [INDICATORS[name.lower()] for name in IndIdx.__members__],
+    dtype=np.int32,
+)
+
 # ==================== FEATURE ENGINEERING ====================
 
 # Data history requirements
@@ -255,22 +297,115 @@ ENABLE_BACKTESTING = True
 SAVE_BACKTEST_DATA = True
 GENERATE_REPORTS = True
 
+# ==================== FROZEN CONFIG SINGLETON ====================
+
+@dataclass(frozen=True, slots=True)
+class IndicatorSettings:
+    """Technical indicator parameters with slot-based attribute access."""
+    sma_short: int = 20
+    sma_long: int = 50
+    rsi_period: int = 14
+    bb_period: int = 20
+    bb_std: int = 2
+    macd_fast: int = 12
+    macd_slow: int = 26
+    macd_signal: int = 9
+    atr_period: int = 14
+    stoch_period: int = 14
+    momentum_period: int = 10
+    roc_period: int = 10
+    adx_period: int = 14
+
+INDICATOR_SETTINGS = IndicatorSettings(**INDICATORS)
+
+@dataclass(frozen=True, slots=True)
+class StrategyConfig:
+    """
+    Immutable snapshot of the core strategy settings.
+
+    Frozen slots give hot-loop readers fixed-offset attribute access
+    instead of module-dict lookups, and the immutability guarantee lets
+    callers cache values safely. The module-level constants above remain
+    the canonical definitions; CONFIG mirrors them for fast access.
+    """
+    strategy_name: str
+    strategy_version: str
+    start_date: datetime
+    end_date: datetime
+    initial_cash: int
+    symbols: tuple
+    rebalance_frequency: int
+    rebalance_hour: int
+    rebalance_minute: int
+    max_position_size: float
+    max_total_allocation: float
+    min_trade_size: float
+    max_drawdown_threshold: float
+    high_volatility_threshold: float
+    risk_free_rate: float
+    model_path: str
+    feature_columns: tuple
+    prediction_threshold: float
+    validate_model_on_load: bool
+    lookback_period: int
+    min_history_required: int
+    indicators: IndicatorSettings
+
+CONFIG = StrategyConfig(
+    strategy_name=STRATEGY_NAME,
+    strategy_version=STRATEGY_VERSION,
+    start_date=START_DATE,
+    end_date=END_DATE,
+    initial_cash=INITIAL_CASH,
+    symbols=SYMBOLS,
+    rebalance_frequency=REBALANCE_FREQUENCY,
+    rebalance_hour=REBALANCE_HOUR,
+    rebalance_minute=REBALANCE_MINUTE,
+    max_position_size=MAX_POSITION_SIZE,
+    max_total_allocation=MAX_TOTAL_ALLOCATION,
+    min_trade_size=MIN_TRADE_SIZE,
+    max_drawdown_threshold=MAX_DRAWDOWN_THRESHOLD,
+    high_volatility_threshold=HIGH_VOLATILITY_THRESHOLD,
+    risk_free_rate=RISK_FREE_RATE,
+    model_path=MODEL_PATH,
+    feature_columns=FEATURE_COLUMNS,
+    prediction_threshold=PREDICTION_THRESHOLD,
+    validate_model_on_load=VALIDATE_MODEL_ON_LOAD,
+    lookback_period=LOOKBACK_PERIOD,
+    min_history_required=MIN_HISTORY_REQUIRED,
+    indicators=INDICATOR_SETTINGS,
+)
+
 # ==================== HELPER FUNCTIONS ====================
 
+def apply_feature_clipping(features: np.ndarray) -> np.ndarray:
+    """Clip features to the configured bounds in place.
+
+    Broadcasting handles both (F,) vectors and (N, F) matrices in a
+    single vectorized pass instead of per-feature Python loops.
+    """
+    return np.clip(features, FEATURE_CLIP_LO, FEATURE_CLIP_HI, out=features)
+
+# Per-symbol overrides, built once at import; get_symbol_config hands
+# out read-only views so the shared dicts cannot be mutated by callers
+_SYMBOL_CONFIGS = {
+    'SPY': {'max_position': 0.20, 'rebalance_threshold': 0.02},
+    'QQQ': {'max_position': 0.15, 'rebalance_threshold': 0.02},
+    'IWM': {'max_position': 0.10, 'rebalance_threshold': 0.03},
+    'EFA': {'max_position': 0.10, 'rebalance_threshold': 0.03},
+    'EEM': {'max_position': 0.08, 'rebalance_threshold': 0.03},
+}
+_DEFAULT_SYMBOL_CONFIG = {
+    'max_position': MAX_POSITION_SIZE,
+    'rebalance_threshold': MIN_TRADE_SIZE,
+}
+
+@functools.lru_cache(maxsize=32)
 def get_symbol_config(symbol: str) -> Dict[str, Any]:
-    """Get symbol-specific configuration if needed."""
-    symbol_configs = {
-        'SPY': {'max_position': 0.20, 'rebalance_threshold': 0.02},
-        'QQQ': {'max_position': 0.15, 'rebalance_threshold': 0.02},
-        'IWM': {'max_position': 0.10, 'rebalance_threshold': 0.03},
-        'EFA': {'max_position': 0.10, 'rebalance_threshold': 0.03},
-        'EEM': {'max_position': 0.08, 'rebalance_threshold': 0.03},
-    }
-    return symbol_configs.get(symbol, {
-        'max_position': MAX_POSITION_SIZE,
-        'rebalance_threshold': MIN_TRADE_SIZE
-    })
+    """Get symbol-specific configuration if needed (cached per symbol)."""
+    return MappingProxyType(_SYMBOL_CONFIGS.get(symbol, _DEFAULT_SYMBOL_CONFIG))
 
+@functools.cache
 def get_risk_config() -> Dict[str, Any]:
     """Get risk management configuration."""
     return {
@@ -281,6 +416,7 @@ def get_risk_config() -> Dict[str, Any]:
         'risk_free_rate': RISK_FREE_RATE,
     }
 
+@functools.cache
 def get_model_config() -> Dict[str, Any]:
     """Get model configuration."""
     return {
@@ -291,28 +427,26 @@ def get_model_config() -> Dict[str, Any]:
         'validate_on_load': VALIDATE_MODEL_ON_LOAD,
     }
 
+@functools.cache
 def validate_config() -> bool:
-    """Validate configuration settings."""
+    """Validate configuration settings (runs at most once per process).
+
+    The checks are assert statements, so running under python -O strips
+    them from the bytecode entirely.
+    """
     # Check that position sizes don't exceed limits
-    if MAX_POSITION_SIZE > 1.0:
-        raise ValueError("MAX_POSITION_SIZE cannot exceed 1.0")
-    
-    if MAX_TOTAL_ALLOCATION > 1.0:
-        raise ValueError("MAX_TOTAL_ALLOCATION cannot exceed 1.0")
-    
-    # Check that we have symbols defined
-    if not SYMBOLS:
-        raise ValueError("SYMBOLS list cannot be empty")
-    
-    # Check that feature columns are defined
-    if not FEATURE_COLUMNS:
-        raise ValueError("FEATURE_COLUMNS list cannot be empty")
-    
+    assert MAX_POSITION_SIZE <= 1.0, "MAX_POSITION_SIZE cannot exceed 1.0"
+    assert MAX_TOTAL_ALLOCATION <= 1.0, "MAX_TOTAL_ALLOCATION cannot exceed 1.0"
+
+    # Check that symbols and feature columns are defined
+    assert SYMBOLS, "SYMBOLS list cannot be empty"
+    assert FEATURE_COLUMNS, "FEATURE_COLUMNS list cannot be empty"
+
     # Check date consistency
-    if START_DATE >= END_DATE:
-        raise ValueError("START_DATE must be before END_DATE")
-    
+    assert START_DATE < END_DATE, "START_DATE must be before END_DATE"
+
     return True
 
-# Validate configuration on import
-validate_config() 
\ No newline at end of file
+# Validate configuration on import (skipped under PYTHONOPTIMIZE)
+if __debug__:
+    validate_config() 
\ No newline at end of file
@@ -14,47 +14,40 @@ Supports multiple ML frameworks:
 - Custom pickle models
 """
 
+import functools
+import importlib.util
 import os
 import pickle
+import sys
+import textwrap
+import time
 import numpy as np
-import pandas as pd
+from types import MappingProxyType
 from typing import Any, List, Optional, Dict, Union
-from datetime import datetime
+from datetime import datetime, timedelta
 import logging
 import warnings
 
-# Optional imports for different ML frameworks
-try:
-    import xgboost as xgb
-    HAS_XGBOOST = True
-except ImportError:
-    HAS_XGBOOST = False
-
-try:
-    import lightgbm as lgb
-    HAS_LIGHTGBM = True
-except ImportError:
-    HAS_LIGHTGBM = False
-
-try:
-    import tensorflow as tf
-    HAS_TENSORFLOW = True
-except ImportError:
-    HAS_TENSORFLOW = False
-    tf = None
-
-try:
-    import torch
-    HAS_TORCH = True
-except ImportError:
-    HAS_TORCH = False
-    torch = None
+# Availability flags for optional ML frameworks. The frameworks
+# themselves are imported lazily inside the branches that need them —
+# importing e.g. TensorFlow at module load costs hundreds of ms and
+# tens of MB even for strategies that never use it.
+HAS_XGBOOST = importlib.util.find_spec('xgboost') is not None
+HAS_LIGHTGBM = importlib.util.find_spec('lightgbm') is not None
+HAS_TENSORFLOW = importlib.util.find_spec('tensorflow') is not None
+HAS_TORCH = importlib.util.find_spec('torch') is not None
+HAS_SKLEARN = importlib.util.find_spec('sklearn') is not None
+HAS_JOBLIB = importlib.util.find_spec('joblib') is not None
+HAS_ORJSON = importlib.util.find_spec('orjson') is not None
+HAS_NUMBA = importlib.util.find_spec('numba') is not None
 
+# Strategy config settings (the loader can also be used standalone, in
+# which case no clipping is applied and validation defaults to on)
 try:
-    import sklearn
-    HAS_SKLEARN = True
+    from config import FEATURE_CLIPPING, VALIDATE_MODEL_ON_LOAD
 except ImportError:
-    HAS_SKLEARN = False
+    FEATURE_CLIPPING = {}
+    VALIDATE_MODEL_ON_LOAD = True
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -65,6 +58,115 @@ warnings.filterwarnings('ignore', category=UserWarning)
 warnings.filterwarnings('ignore', category=FutureWarning)
 
 
+def _prep_fallback(X, lo, hi, out):
+    """Numpy input prep: zero non-finite values, clip, cast to float32.
+
+    Used when numba is unavailable; does three memory passes where the
+    jitted kernel does one.
+    """
+    np.copyto(out, X, casting='unsafe')
+    np.nan_to_num(out, copy=False, nan=0.0, posinf=0.0, neginf=0.0)
+    np.clip(out, lo, hi, out=out)
+
+
+@functools.lru_cache(maxsize=8)
+def _prep_row_factory(n_features: int):
+    """Generate a single-row prep function for a fixed feature count.
+
+    The feature width is inlined as a literal at codegen time, so the
+    reshape doubles as the input-size validation and the hot path avoids
+    per-call ndim/shape checks. The lru_cache means repeated loader
+    instantiations with the same width reuse the compiled function.
+    """
+    src = textwrap.dedent(f"""
+        def _prep_row(features, lo, hi, out, kernel):
+            kernel(features.reshape(1, {n_features}), lo, hi, out)
+            return out
+    """)
+    namespace = {}
+    exec(compile(src, f'<prep_row[{n_features}]>', 'exec'), namespace)
+    return namespace['_prep_row']
+
+
+# Model-class -> type-name registry for _determine_model_type. Only
+# frameworks already imported get registered: loading a model necessarily
+# imports its framework, so anything absent from sys.modules cannot be
+# the model's type. Rebuilt only when the set of loaded frameworks grows.
+_FRAMEWORK_MODULES = ('xgboost', 'lightgbm', 'tensorflow', 'torch', 'sklearn')
+_MODEL_DISPATCH = None
+_DISPATCH_MODULES = frozenset()
+
+
+def _model_dispatch():
+    """Return (class, type_name) pairs for isinstance-based detection."""
+    global _MODEL_DISPATCH, _DISPATCH_MODULES
+    present = frozenset(m for m in _FRAMEWORK_MODULES if m in sys.modules)
+    if _MODEL_DISPATCH is None or present != _DISPATCH_MODULES:
+        dispatch = []
+        # Boosting libraries first: their sklearn wrappers also subclass
+        # sklearn's BaseEstimator
+        if 'xgboost' in present:
+            import xgboost as xgb
+            dispatch.append((xgb.Booster, 'XGBoost'))
+            if hasattr(xgb, 'XGBModel'):
+                dispatch.append((xgb.XGBModel, 'XGBoost'))
+        if 'lightgbm' in present:
+            import lightgbm as lgb
+            dispatch.append((lgb.Booster, 'LightGBM'))
+            if hasattr(lgb, 'LGBMModel'):
+                dispatch.append((lgb.LGBMModel, 'LightGBM'))
+        if 'tensorflow' in present:
+            import tensorflow as tf
+            dispatch.append((tf.keras.Model, 'TensorFlow'))
+        if 'torch' in present:
+            import torch
+            dispatch.append((torch.nn.Module, 'PyTorch'))
+        if 'sklearn' in present:
+            from sklearn.base import BaseEstimator
+            dispatch.append((BaseEstimator, 'Scikit-learn'))
+        _MODEL_DISPATCH = dispatch
+        _DISPATCH_MODULES = present
+    return _MODEL_DISPATCH
+
+
+_prep_kernel = None
+
+
+def _get_prep_kernel():
+    """Return the input prep kernel, jit-compiling it on first use.
+
+    The numba version fuses the non-finite replacement, per-feature clip
+    and float32 cast into a single loop, so each element is read from
+    memory once instead of three times.
+    """
+    global _prep_kernel
+    if _prep_kernel is None:
+        if HAS_NUMBA:
+            from numba import njit
+
+            # No fastmath: its nnan/ninf flags would let LLVM assume
+            # operands are never NaN/inf and fold away the isfinite
+            # guard, which is the whole point of this kernel. The loop
+            # is memory-bound anyway, so fastmath buys nothing here.
+            @njit(cache=True)
+            def _prep(X, lo, hi, out):
+                for i in range(X.shape[0]):
+                    for j in range(X.shape[1]):
+                        v = X[i, j]
+                        if not np.isfinite(v):
+                            v = 0.0
+                        if v < lo[j]:
+                            v = lo[j]
+                        elif v > hi[j]:
+                            v = hi[j]
+                        out[i, j] = v
+
+            _prep_kernel = _prep
+        else:
+            _prep_kernel = _prep_fallback
+    return _prep_kernel
+
+
 class ModelLoader:
     """
     Enhanced model loader that supports multiple ML frameworks with better error handling.
@@ -78,25 +180,57 @@ class ModelLoader:
     - Custom pickle models
     """
     
-    def __init__(self, model_path: str, feature_columns: List[str]):
+    def __init__(self, model_path: str, feature_columns: List[str],
+                 validate_on_load: Optional[bool] = None):
         """
         Initialize the ModelLoader.
-        
+
         Args:
             model_path: Path to the trained model file
             feature_columns: List of feature column names
+            validate_on_load: Run a dummy prediction after loading;
+                defaults to the VALIDATE_MODEL_ON_LOAD config setting
         """
         self.model_path = model_path
         self.feature_columns = feature_columns
+        self.validate_on_load = VALIDATE_MODEL_ON_LOAD if validate_on_load is None else validate_on_load
         self.model = None
         self.model_type = None
         self.feature_importance = None
         self.model_metadata = {}
+
+        # Cached once so the hot path avoids len() per call
+        self._n_features = len(feature_columns)
+        # Specialized predict callable, bound once in _determine_model_type
+        self._predict_fn = None
+        # Reusable single-row input buffer; float32 halves memory
+        # bandwidth for frameworks that accept it
+        self._buf = np.empty((1, self._n_features), dtype=np.float32)
+        # Per-feature clip bounds aligned with feature_columns (infinite
+        # where unconfigured), consumed by the fused prep kernel
+        self._clip_lo = np.array(
+            [FEATURE_CLIPPING.get(c, (-np.inf, np.inf))[0] for c in feature_columns],
+            dtype=np.float32,
+        )
+        self._clip_hi = np.array(
+            [FEATURE_CLIPPING.get(c, (-np.inf, np.inf))[1] for c in feature_columns],
+            dtype=np.float32,
+        )
+        self._prep = _get_prep_kernel()
+        # Row prep specialized to this loader's fixed feature width
+        self._prep_row = _prep_row_factory(self._n_features)
+        # Warm the kernel so JIT compilation doesn't hit the first tick
+        self._prep(np.zeros((1, self._n_features)), self._clip_lo, self._clip_hi, self._buf)
         
-        # Performance tracking
+        # Performance tracking. Predictions record only a cheap monotonic
+        # counter; get_model_info converts it to wall-clock time on demand
+        # using the anchors captured here, instead of building a datetime
+        # object on every call.
         self.prediction_count = 0
         self.error_count = 0
-        self.last_prediction_time = None
+        self._boot_wallclock = datetime.now()
+        self._boot_mono_ns = time.monotonic_ns()
+        self._last_pred_ns = None
         
         # Load the model on initialization
         success, message = self.load_model()
@@ -115,11 +249,10 @@ class ModelLoader:
             # Check if file exists
             if not os.path.exists(self.model_path):
                 return False, f"Model file not found: {self.model_path}"
-            
-            # Load the model
-            with open(self.model_path, 'rb') as f:
-                model_data = pickle.load(f)
-            
+
+            # Load the model with the fastest loader for its format
+            model_data = self._load_by_format()
+
             # Handle different model formats
             if isinstance(model_data, dict):
                 # Model with metadata
@@ -129,15 +262,21 @@ class ModelLoader:
             else:
                 # Direct model object
                 self.model = model_data
-            
+
+            # Sidecar metadata can be read without touching the model file
+            sidecar_metadata = self._load_sidecar_metadata()
+            if sidecar_metadata:
+                self.model_metadata = {**sidecar_metadata, **self.model_metadata}
+
+            # Determine model type and bind the predict callable before
+            # validation so the dummy prediction exercises the real path
+            self._determine_model_type()
+
             # Validate model
             validation_success, validation_message = self._validate_model()
             if not validation_success:
                 return False, validation_message
-            
-            # Determine model type
-            self._determine_model_type()
-            
+
             logger.info(f"Successfully loaded {self.model_type} model from {self.model_path}")
             return True, f"Model loaded successfully: {self.model_type}"
             
@@ -146,6 +285,81 @@ class ModelLoader:
             logger.error(error_msg)
             return False, error_msg
     
+    def _load_by_format(self) -> Any:
+        """
+        Load the model file using the fastest loader for its format.
+
+        Framework-native formats (XGBoost .json/.ubj, LightGBM .txt,
+        Keras .h5/.keras, PyTorch .pt/.pth) skip the pickle opcode
+        interpreter entirely. Everything else goes through joblib with
+        memory-mapped numpy arrays (zero-copy, shared across processes),
+        falling back to plain pickle if joblib is unavailable.
+
+        Returns:
+            The loaded model object (or dict with metadata)
+        """
+        suffix = os.path.splitext(self.model_path)[1].lower()
+
+        if suffix in ('.json', '.ubj') and HAS_XGBOOST:
+            import xgboost as xgb
+            booster = xgb.Booster()
+            booster.load_model(self.model_path)
+            return booster
+
+        if suffix == '.txt' and HAS_LIGHTGBM:
+            import lightgbm as lgb
+            return lgb.Booster(model_file=self.model_path)
+
+        if suffix in ('.h5', '.keras') and HAS_TENSORFLOW:
+            import tensorflow as tf
+            return tf.keras.models.load_model(self.model_path, compile=False)
+
+        if suffix in ('.pt', '.pth') and HAS_TORCH:
+            import torch
+            try:
+                # mmap=True maps tensor storages from the page cache
+                # instead of copying them into private heap memory
+                return torch.load(self.model_path, weights_only=True,
+                                  map_location='cpu', mmap=True)
+            except TypeError:
+                # mmap kwarg requires a recent torch
+                return torch.load(self.model_path, weights_only=True, map_location='cpu')
+
+        # .joblib/.jbl and legacy .pkl both go through joblib so numpy
+        # arrays are memory-mapped and shared across worker processes
+        if HAS_JOBLIB:
+            import joblib
+            return joblib.load(self.model_path, mmap_mode='r')
+
+        with open(self.model_path, 'rb') as f:
+            return pickle.load(f)
+
+    def _load_sidecar_metadata(self) -> Dict[str, Any]:
+        """
+        Read metadata from the sidecar '<model_path>.meta.json' if present.
+
+        Keeping metadata in a sidecar file means callers can inspect it
+        without re-loading a large model pickle.
+
+        Returns:
+            Metadata dictionary (empty if no sidecar exists)
+        """
+        meta_path = self.model_path + '.meta.json'
+        if not os.path.exists(meta_path):
+            return {}
+
+        try:
+            with open(meta_path, 'rb') as f:
+                raw = f.read()
+            if HAS_ORJSON:
+                import orjson
+                return orjson.loads(raw)
+            import json
+            return json.loads(raw)
+        except Exception as e:
+            logger.warning(f"Failed to read model metadata sidecar: {str(e)}")
+            return {}
+
     def _validate_model(self):
         """
         Validate the loaded model.
@@ -159,36 +373,144 @@ class ModelLoader:
         # Check if model has predict method
         if not self._has_predict_method():
             return False, "Model does not have a predict method"
-        
+
+        # The dummy prediction below can trigger seconds of graph/JIT
+        # compilation for TF/PyTorch models, so it is skippable
+        if not self.validate_on_load:
+            return True, "Model validation skipped (validate_on_load=False)"
+
         # Test prediction with dummy data
         try:
-            dummy_features = np.random.random((1, len(self.feature_columns)))
+            dummy_features = np.random.random((1, self._n_features))
             _ = self._safe_predict(dummy_features)
             return True, "Model validation successful"
         except Exception as e:
             return False, f"Model validation failed: {str(e)}"
     
     def _determine_model_type(self):
-        """Determine the type of loaded model."""
-        model_class = self.model.__class__.__name__
-        module_name = self.model.__class__.__module__
-        
-        if 'xgboost' in module_name:
-            self.model_type = 'XGBoost'
-        elif 'lightgbm' in module_name:
-            self.model_type = 'LightGBM'
-        elif 'tensorflow' in module_name or 'keras' in module_name:
-            self.model_type = 'TensorFlow'
-        elif 'torch' in module_name:
-            self.model_type = 'PyTorch'
-        elif 'sklearn' in module_name:
-            self.model_type = 'Scikit-learn'
+        """Determine the type of loaded model via the class registry."""
+        self.model_type = None
+        for cls, type_name in _model_dispatch():
+            if isinstance(self.model, cls):
+                self.model_type = type_name
+                break
+
+        if self.model_type is None:
+            self.model_type = f'Custom ({self.model.__class__.__name__})'
+
+        self._bind_predict_fn()
+        self._cache_feature_importance()
+
+    def _cache_feature_importance(self):
+        """
+        Extract feature importance once at load and freeze it.
+
+        The importance vector is immutable after loading, so computing
+        the name->value mapping here (behind a read-only proxy) lets
+        repeated introspection calls from dashboards/logging return the
+        cached mapping instead of rebuilding a dict each time.
+        """
+        importance = self.feature_importance  # may come from the model file
+
+        if importance is None:
+            model = self.model
+            if hasattr(model, 'feature_importances_'):
+                importance = model.feature_importances_
+            elif hasattr(model, 'feature_importance'):
+                try:
+                    importance = model.feature_importance()
+                except Exception:
+                    importance = None
+            elif hasattr(model, 'coef_'):
+                importance = np.abs(model.coef_).ravel()
+
+        if importance is None:
+            self.feature_importance = None
+            return
+
+        if isinstance(importance, dict):
+            self.feature_importance = MappingProxyType(dict(importance))
+            return
+
+        importance = np.asarray(importance, dtype=np.float32)
+        if len(importance) == self._n_features:
+            self.feature_importance = MappingProxyType(dict(zip(self.feature_columns, importance)))
         else:
-            self.model_type = f'Custom ({model_class})'
+            self.feature_importance = None
+
+    def _bind_predict_fn(self):
+        """
+        Bind a backend-specific predict callable once.
+
+        Choosing the backend here instead of branching in _safe_predict
+        removes the per-call string compares and attribute lookups from
+        the prediction hot path.
+        """
+        if self.model_type == 'XGBoost':
+            # Booster.predict builds a DMatrix internally on every call;
+            # inplace_predict on the raw booster skips that entirely
+            booster = self.model.get_booster() if hasattr(self.model, 'get_booster') else self.model
+            self._booster = booster
+            if hasattr(booster, 'inplace_predict'):
+                self._predict_fn = booster.inplace_predict
+            else:
+                # Older xgboost without inplace_predict: predict through
+                # a DMatrix over the pinned float32 input buffer. DMatrix
+                # snapshots its data at construction, so it has to be
+                # rebuilt per call, but the contiguous buffer and the
+                # prebuilt feature-name list are reused, keeping the
+                # per-call conversion work minimal.
+                import xgboost as xgb
+                feature_names = list(self.feature_columns)
+
+                def dmatrix_predict(x):
+                    return booster.predict(
+                        xgb.DMatrix(x, feature_names=feature_names, nthread=1))
+
+                self._predict_fn = dmatrix_predict
+        elif self.model_type == 'LightGBM':
+            # Raw booster predict with the shape check disabled avoids
+            # per-call input re-validation
+            booster = self.model.booster_ if hasattr(self.model, 'booster_') else self.model
+            self._booster = booster
+            self._predict_fn = lambda x: booster.predict(x, predict_disable_shape_check=True)
+        elif self.model_type == 'TensorFlow':
+            model = self.model
+            self._predict_fn = lambda x: model.predict(x, verbose=0).ravel()
+        elif self.model_type == 'PyTorch':
+            import torch
+            self._torch = torch
+            model = self.model
+            # Freeze inference behavior (dropout/batchnorm) once at load
+            model.eval()
+            try:
+                # A frozen TorchScript graph is faster still, when the
+                # model can be scripted
+                model = torch.jit.optimize_for_inference(torch.jit.script(model))
+            except Exception:
+                pass
+
+            # Zero-copy tensor view over the shared float32 input buffer:
+            # predict() writes features into self._buf and this view sees
+            # them without any ndarray->tensor copy
+            buf_view = torch.from_numpy(self._buf)
+
+            def torch_predict(x):
+                with torch.inference_mode():
+                    if x is self._buf:
+                        return model(buf_view).numpy()
+                    tensor = torch.from_numpy(np.ascontiguousarray(x, dtype=np.float32))
+                    return model(tensor).numpy()
+
+            self._predict_fn = torch_predict
+            self._torch_model = model
+        else:
+            # Standard sklearn-compatible models
+            self._predict_fn = self.model.predict
     
     def _has_predict_method(self) -> bool:
-        """Check if model has predict method."""
-        return hasattr(self.model, 'predict') and callable(getattr(self.model, 'predict'))
+        """Check if model has predict method (single attribute lookup)."""
+        return callable(getattr(self.model, 'predict', None))
     
     def _safe_predict(self, features: np.ndarray) -> Optional[Union[float, np.ndarray]]:
         """
@@ -201,22 +523,7 @@ class ModelLoader:
             Prediction result or None if failed
         """
         try:
-            # Handle different model types
-            if self.model_type == 'TensorFlow':
-                # TensorFlow/Keras models
-                prediction = self.model.predict(features, verbose=0)
-                return prediction.flatten() if len(prediction.shape) > 1 else prediction
-            elif self.model_type == 'PyTorch':
-                # PyTorch models
-                import torch
-                with torch.no_grad():
-                    tensor_features = torch.FloatTensor(features)
-                    prediction = self.model(tensor_features)
-                    return prediction.numpy()
-            else:
-                # Standard sklearn-compatible models
-                return self.model.predict(features)
-                
+            return self._predict_fn(features)
         except Exception as e:
             logger.error(f"Prediction error: {str(e)}")
             return None
@@ -237,42 +544,42 @@ class ModelLoader:
                 logger.warning("Empty features provided for prediction")
                 return None
             
-            # Ensure features are 2D
-            if features.ndim == 1:
-                features = features.reshape(1, -1)
-            
-            # Check feature count
-            if features.shape[1] != len(self.feature_columns):
-                logger.error(f"Feature count mismatch: expected {len(self.feature_columns)}, got {features.shape[1]}")
-                return None
-            
-            # Handle NaN values
-            if np.any(np.isnan(features)):
-                logger.warning("NaN values detected in features, replacing with 0")
-                features = np.nan_to_num(features)
-            
+            # Specialized single fused pass into the preallocated buffer:
+            # non-finite replacement, per-feature clip and float32 cast,
+            # with the feature width inlined at codegen time. The reshape
+            # inside rejects any input whose size isn't exactly the
+            # expected width.
+            self._prep_row(features, self._clip_lo, self._clip_hi, self._buf, self._prep)
+
             # Make prediction
-            prediction = self._safe_predict(features)
+            prediction = self._safe_predict(self._buf)
             
             if prediction is None:
                 self.error_count += 1
                 return None
             
-            # Handle different prediction formats
+            # Handle different prediction formats; .item() is numpy's
+            # scalar fast path (cheaper than float(arr[0]))
             if isinstance(prediction, np.ndarray):
-                result = float(prediction[0]) if len(prediction) > 0 else 0.0
+                result = prediction.item(0) if prediction.size else 0.0
             else:
                 result = float(prediction)
-            
+
             # Update tracking
             self.prediction_count += 1
-            self.last_prediction_time = datetime.now()
-            
-            # Clamp extreme values for safety
-            if abs(result) > 1e6:
+            self._last_pred_ns = time.monotonic_ns()
+
+            # Clamp extreme values for safety with plain branches —
+            # np.clip on a scalar allocates a 0-d array
+            if result != result:  # NaN
+                result = 0.0
+            elif result < -1e6:
                 logger.warning(f"Extreme prediction value detected: {result}, clamping to [-1e6, 1e6]")
-                result = np.clip(result, -1e6, 1e6)
-            
+                result = -1e6
+            elif result > 1e6:
+                logger.warning(f"Extreme prediction value detected: {result}, clamping to [-1e6, 1e6]")
+                result = 1e6
+
             return result
             
         except Exception as e:
@@ -280,6 +587,46 @@ class ModelLoader:
             self.error_count += 1
             return None
     
+    def predict_batch(self, features_2d: np.ndarray) -> Optional[np.ndarray]:
+        """
+        Make predictions for several symbols in a single call.
+
+        Stacking per-symbol feature rows into one (N, F) matrix amortizes
+        the Python-to-C dispatch (and any framework-side input conversion)
+        across rows instead of paying it once per symbol.
+
+        Args:
+            features_2d: Input features as a 2D (n_symbols, n_features) array
+
+        Returns:
+            1D array of predictions or None if failed
+        """
+        try:
+            features_2d = np.ascontiguousarray(features_2d, dtype=np.float32)
+            if features_2d.ndim != 2 or features_2d.shape[1] != self._n_features:
+                logger.error(f"predict_batch expects (N, {self._n_features}) input, got {features_2d.shape}")
+                return None
+
+            # Fused non-finite replacement and clip, in place
+            self._prep(features_2d, self._clip_lo, self._clip_hi, features_2d)
+
+            predictions = self._safe_predict(features_2d)
+
+            if predictions is None:
+                self.error_count += 1
+                return None
+
+            # Update tracking
+            self.prediction_count += features_2d.shape[0]
+            self._last_pred_ns = time.monotonic_ns()
+
+            return np.asarray(predictions).ravel()
+
+        except Exception as e:
+            logger.error(f"Batch prediction failed: {str(e)}")
+            self.error_count += 1
+            return None
+
     def predict_proba(self, features: np.ndarray) -> Optional[np.ndarray]:
         """
         Get prediction probabilities (for classification models).
@@ -313,34 +660,19 @@ class ModelLoader:
     def get_feature_importance(self) -> Optional[Dict[str, float]]:
         """
         Get feature importance if available.
-        
+
         Returns:
-            Dictionary of feature importance or None
+            Read-only mapping of feature importance (cached at load) or None
         """
-        try:
-            # Return cached importance if available
-            if self.feature_importance is not None:
-                return self.feature_importance
-            
-            # Try to get from model
-            importance = None
-            if hasattr(self.model, 'feature_importances_'):
-                importance = self.model.feature_importances_
-            elif hasattr(self.model, 'feature_importance'):
-                importance = self.model.feature_importance()
-            elif hasattr(self.model, 'coef_'):
-                importance = np.abs(self.model.coef_).flatten()
-            
-            if importance is not None and len(importance) == len(self.feature_columns):
-                self.feature_importance = dict(zip(self.feature_columns, importance))
-                return self.feature_importance
-            
-            return None
-            
-        except Exception as e:
-            logger.error(f"Failed to get feature importance: {str(e)}")
-            return None
+        return self.feature_importance
     
+    def _last_prediction_datetime(self) -> Optional[datetime]:
+        """Convert the monotonic prediction timestamp to wall-clock time."""
+        if self._last_pred_ns is None:
+            return None
+        elapsed_us = (self._last_pred_ns - self._boot_mono_ns) / 1000
+        return self._boot_wallclock + timedelta(microseconds=elapsed_us)
+
     def get_model_info(self) -> Dict[str, Any]:
         """
         Get model information and statistics.
@@ -355,7 +687,7 @@ class ModelLoader:
             'prediction_count': self.prediction_count,
             'error_count': self.error_count,
             'error_rate': self.error_count / max(self.prediction_count, 1),
-            'last_prediction_time': self.last_prediction_time,
+            'last_prediction_time': self._last_prediction_datetime(),
             'has_feature_importance': self.get_feature_importance() is not None,
             'metadata': self.model_metadata
         }
@@ -370,11 +702,16 @@ class ModelLoader:
             Tuple of (success, message)
         """
         try:
-            # Reset state
+            # Reset state, including the bound backend callables — if the
+            # reload fails, predict() must fail closed instead of serving
+            # stale predictions through the previous model's closure
             self.model = None
             self.model_type = None
             self.feature_importance = None
             self.model_metadata = {}
+            self._predict_fn = None
+            self._booster = None
+            self._torch_model = None
             
             # Reload
             return self.load_model()
@@ -414,7 +751,11 @@ class ModelLoader:
             
             with open(output_path, 'wb') as f:
                 pickle.dump(model_data, f)
-            
+
+            # Write metadata to a sidecar so it can be read without
+            # re-loading the full model pickle
+            self._save_sidecar_metadata(output_path, metadata)
+
             logger.info(f"Model saved successfully to {output_path}")
             return True
             
@@ -422,6 +763,57 @@ class ModelLoader:
             logger.error(f"Failed to save model: {str(e)}")
             return False
 
+    def save_with_joblib(self, model: Any, output_path: str,
+                         metadata: Optional[Dict[str, Any]] = None) -> bool:
+        """
+        Save a model with joblib so workers can memory-map it on load.
+
+        compress=0 keeps numpy arrays inside the model as raw blocks
+        that joblib.load(..., mmap_mode='r') can map straight from the
+        page cache, so N worker processes share one physical copy of a
+        large model instead of each holding a private heap copy.
+
+        Args:
+            model: The model to save
+            output_path: Path to save the model (use a .joblib suffix)
+            metadata: Optional metadata written to the sidecar file
+
+        Returns:
+            True if successful, False otherwise
+        """
+        if not HAS_JOBLIB:
+            logger.error("joblib is not available; cannot save model")
+            return False
+
+        try:
+            import joblib
+            joblib.dump(model, output_path, compress=0, protocol=5)
+
+            if metadata is not None:
+                self._save_sidecar_metadata(output_path, metadata)
+
+            logger.info(f"Model saved successfully to {output_path}")
+            return True
+
+        except Exception as e:
+            logger.error(f"Failed to save model: {str(e)}")
+            return False
+
+    def _save_sidecar_metadata(self, output_path: str, metadata: Dict[str, Any]):
+        """Write metadata to '<output_path>.meta.json'."""
+        try:
+            meta_path = output_path + '.meta.json'
+            if HAS_ORJSON:
+                import orjson
+                raw = orjson.dumps(metadata)
+            else:
+                import json
+                raw = json.dumps(metadata, default=str).encode()
+            with open(meta_path, 'wb') as f:
+                f.write(raw)
+        except Exception as e:
+            logger.warning(f"Failed to write metadata sidecar: {str(e)}")
+
 
 class FallbackPredictor:
     """
@@ -464,15 +856,18 @@ class FallbackPredictor:
         }
 
 
-def create_model_loader(model_path: str, feature_columns: List[str]) -> ModelLoader:
+def create_model_loader(model_path: str, feature_columns: List[str],
+                        validate_on_load: Optional[bool] = None) -> ModelLoader:
     """
     Factory function to create a ModelLoader instance.
-    
+
     Args:
         model_path: Path to the model file
         feature_columns: List of feature column names
-        
+        validate_on_load: Run a dummy prediction after loading;
+            defaults to the VALIDATE_MODEL_ON_LOAD config setting
+
     Returns:
         ModelLoader instance
     """
-    return ModelLoader(model_path, feature_columns) 
\ No newline at end of file
+    return ModelLoader(model_path, feature_columns, validate_on_load=validate_on_load) 
\ No newline at end of file
@@ -13,9 +13,43 @@ Usage:
 
 import json
 import os
+import re
 import shutil
 from pathlib import Path
 
+# Matches KEY=VALUE lines in a .env file. Whitespace is matched with
+# [ \t] (never \s, which would let an empty value swallow the next
+# line), and values run to end of line so credentials containing '#'
+# survive intact — whole-line comments don't match the key pattern
+_ENV_RE = re.compile(r'(?m)^[ \t]*([A-Z_][A-Z0-9_]*)[ \t]*=[ \t]*([^\n]*)')
+
+try:
+    import orjson  # C-accelerated JSON; optional
+except ImportError:
+    orjson = None
+
+def _load_json(path: Path):
+    """Parse a JSON file, preferring orjson when available."""
+    raw = path.read_bytes()
+    return orjson.loads(raw) if orjson else json.loads(raw)
+
+def _dump_json(path: Path, data):
+    """Write JSON with indentation, preferring orjson when available."""
+    if orjson:
+        path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        path.write_text(json.dumps(data, indent=2))
+
+def _substitute(value, replacements):
+    """Recursively replace placeholder strings in a parsed JSON document."""
+    if isinstance(value, str):
+        return replacements.get(value, value)
+    if isinstance(value, dict):
+        return {k: _substitute(v, replacements) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_substitute(v, replacements) for v in value]
+    return value
+
 def setup_credentials():
     """Set up credentials for QuantConnect trading."""
     
@@ -47,36 +81,26 @@ def setup_credentials():
     if env_file.exists():
         print("🔄 Loading environment variables from .env")
         
-        # Load .env file
-        env_vars = {}
-        with open(env_file, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith('#') and '=' in line:
-                    key, value = line.split('=', 1)
-                    env_vars[key.strip()] = value.strip()
+        # Load .env file in a single regex pass over the whole text
+        env_vars = {key: value.strip() for key, value in _ENV_RE.findall(env_file.read_text())}
         
-        # Read lean.json
-        with open(lean_config, 'r') as f:
-            config = json.load(f)
-        
-        # Replace placeholders
+        # Read lean.json once
+        config = _load_json(lean_config)
+
+        # Replace placeholders (only the ones we have values for)
         replacements = {
             "${IBKR_ACCOUNT}": env_vars.get('IBKR_ACCOUNT', ''),
             "${IBKR_USERNAME}": env_vars.get('IBKR_USERNAME', ''),
             "${IBKR_PASSWORD}": env_vars.get('IBKR_PASSWORD', ''),
         }
-        
-        # Update config
-        for old, new in replacements.items():
-            if new:  # Only replace if we have a value
-                config_str = json.dumps(config)
-                config_str = config_str.replace(old, new)
-                config = json.loads(config_str)
-        
+        replacements = {old: new for old, new in replacements.items() if new}
+
+        # Substitute placeholder leaves in place — no serialize/parse
+        # round-trip per replacement
+        config = _substitute(config, replacements)
+
         # Write updated config
-        with open(lean_config, 'w') as f:
-            json.dump(config, f, indent=4)
+        _dump_json(lean_config, config)
         
         print("✅ Updated lean.json with environment variables")
     